@@ -6,18 +6,22 @@ Endpoints:
 - GET /health - Health check
 """
 
+import asyncio
 import os
+import warnings
 from pathlib import Path
 from typing import Optional
 
 import joblib
+import numpy as np
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from .astronomy import calculate_astronomy
-from .features import FEATURE_ORDER, engineer_features
+from .client import CLIENT
+from .features import FEATURE_ORDER, engineer_features_into
 from .space_weather import get_space_weather
 from .weather import get_weather
 
@@ -46,6 +50,40 @@ except FileNotFoundError:
     gb_model = joblib.load("../models/gb.joblib")
     xgb_model = joblib.load("../models/xgb.joblib")
 
+# Models are fed positional rows in FEATURE_ORDER, so the column order they
+# were trained on has to match it exactly (checked once, after every retrain)
+if list(gb_model.feature_names_in_) != FEATURE_ORDER:
+    raise RuntimeError("gb.joblib feature order does not match FEATURE_ORDER")
+if xgb_model.get_booster().feature_names != FEATURE_ORDER:
+    raise RuntimeError("xgb.joblib feature order does not match FEATURE_ORDER")
+
+# Single-row inference: thread fan-out costs more than it saves, and
+# concurrent requests across workers already fill the cores.
+# (GradientBoostingClassifier predicts single-threaded already.)
+xgb_model.set_params(n_jobs=1)
+
+# Native booster: inplace_predict skips the sklearn wrapper and DMatrix build
+xgb_booster = xgb_model.get_booster()
+xgb_booster.set_param({"nthread": 1})
+
+# Early-stopped models keep trees past the best iteration; predict with only
+# the kept ones, as predict_proba does ((0, 0) means all trees)
+_best_iteration = getattr(xgb_model, "best_iteration", None)
+XGB_ITERATION_RANGE = (0, _best_iteration + 1) if _best_iteration is not None else (0, 0)
+
+# Models were fitted on a DataFrame but are fed a plain array in FEATURE_ORDER
+# (order verified above)
+warnings.filterwarnings(
+    "ignore",
+    message="X does not have valid feature names",
+    category=UserWarning,
+    module="sklearn",
+)
+
+# Reusable model input row. Filled and consumed with no await in between,
+# so concurrent requests on the event loop never interleave on it.
+_ROW = np.empty((1, len(FEATURE_ORDER)), dtype=np.float32)
+
 
 class PredictRequest(BaseModel):
     latitude: float
@@ -62,39 +100,54 @@ class PredictResponse(BaseModel):
     conditions: dict
 
 
+@app.on_event("startup")
+async def warm_models():
+    # First predict call allocates internal buffers; pay it before serving traffic
+    X = np.zeros((1, len(FEATURE_ORDER)), dtype=np.float32)
+    gb_model.predict_proba(X)
+    xgb_booster.inplace_predict(X, iteration_range=XGB_ITERATION_RANGE)
+
+
+@app.on_event("shutdown")
+async def close_client():
+    await CLIENT.aclose()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "models_loaded": True}
 
 
-@app.post("/predict", response_model=PredictResponse)
+# Returned directly as ORJSONResponse (no output validation),
+# PredictResponse documents the schema only
+@app.post(
+    "/predict",
+    response_class=ORJSONResponse,
+    responses={200: {"model": PredictResponse}},
+)
 async def predict(request: PredictRequest):
     try:
         lat = request.latitude
         lon = request.longitude
 
-        # 1. Get weather data
-        weather = await get_weather(lat, lon)
-
-        # 2. Get space weather data
-        space = await get_space_weather()
-
-        # 3. Calculate astronomical positions
-        astro = calculate_astronomy(lat, lon, request.timestamp)
-
-        # 4. Build feature vector
-        features = engineer_features(lat, lon, weather, space, astro)
-
-        # 5. Ensure correct feature order
-        import pandas as pd
+        # 1-3. Fetch weather and space weather, calculate astronomical positions
+        # (independent of each other, so run them concurrently)
+        weather, space, astro = await asyncio.gather(
+            get_weather(lat, lon),
+            get_space_weather(),
+            asyncio.to_thread(calculate_astronomy, lat, lon, request.timestamp),
+        )
 
-        X = pd.DataFrame([features])[FEATURE_ORDER]
+        # 4. Build feature vector directly into the model row
+        engineer_features_into(_ROW[0], lat, lon, weather, space, astro)
 
-        # 6. Get predictions from both models
-        gb_prob = float(gb_model.predict_proba(X)[0][1])
-        xgb_prob = float(xgb_model.predict_proba(X)[0][1])
+        # 5. Get predictions from both models
+        gb_prob = float(gb_model.predict_proba(_ROW)[0][1])
+        xgb_prob = float(
+            xgb_booster.inplace_predict(_ROW, iteration_range=XGB_ITERATION_RANGE)[0]
+        )
 
-        # 7. Calculate combined probability and confidence
+        # 6. Calculate combined probability and confidence
         avg_prob = (gb_prob + xgb_prob) / 2
         diff = abs(gb_prob - xgb_prob)
 
@@ -105,7 +158,7 @@ async def predict(request: PredictRequest):
         else:
             confidence = "low"
 
-        # 8. Build conditions summary
+        # 7. Build conditions summary
         conditions = {
             "is_dark": bool(astro["sun_altitude"] < -6),
             "cloud_cover": weather["cloudcover"],
@@ -116,13 +169,13 @@ async def predict(request: PredictRequest):
             ),
         }
 
-        return PredictResponse(
-            probability=round(avg_prob, 3),
-            confidence=confidence,
-            gb_probability=round(gb_prob, 3),
-            xgb_probability=round(xgb_prob, 3),
-            conditions=conditions,
-        )
+        return ORJSONResponse({
+            "probability": round(avg_prob, 3),
+            "confidence": confidence,
+            "gb_probability": round(gb_prob, 3),
+            "xgb_probability": round(xgb_prob, 3),
+            "conditions": conditions,
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
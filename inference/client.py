@@ -0,0 +1,14 @@
+"""
+Shared HTTP client
+
+One pooled AsyncClient for all upstream APIs (NOAA, WeatherKit, Open-Meteo)
+so TLS sessions and keep-alive connections are reused across requests.
+Closed by the app on shutdown.
+"""
+import httpx
+
+CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
@@ -4,6 +4,7 @@ Feature Engineering
 Combines weather, space weather, and astronomy into the 30 features
 required by the model.
 """
+import numpy as np
 
 # Feature order expected by the models (must match training)
 FEATURE_ORDER = [
@@ -15,77 +16,72 @@ FEATURE_ORDER = [
 ]
 
 
-def engineer_features(
+def engineer_features_into(
+    out: np.ndarray,
     lat: float,
     lon: float,
     weather: dict,
     space: dict,
     astro: dict
-) -> dict:
+) -> None:
     """
-    Build the complete feature vector for model prediction.
+    Write the complete feature vector for model prediction into a preallocated row.
 
     Args:
+        out: 1D array of len(FEATURE_ORDER) to fill (e.g. a row of the model input)
         lat: Latitude
         lon: Longitude
         weather: Dict with cloudcover, precip, temp, pressure, windspeed, winddir, humidity, dew
         space: Dict with kp_index, bz, solar_wind_speed, solar_wind_density, dst
         astro: Dict with hour, day_of_year, magnetic_latitude, sun_altitude, moon_phase, moon_illumination, moon_altitude
-
-    Returns:
-        Dict with all 30 features
     """
+    is_dark = astro["sun_altitude"] < -6
+    storm = space["kp_index"] >= 5
 
-    # Base features
-    features = {
+    # Single write, values listed in FEATURE_ORDER
+    out[:] = (
         # Location
-        "latitude": lat,
-        "longitude": lon,
+        lat,
+        lon,
 
         # Time
-        "hour": astro["hour"],
-        "day_of_year": astro["day_of_year"],
+        astro["hour"],
+        astro["day_of_year"],
 
         # Astronomical
-        "magnetic_latitude": astro["magnetic_latitude"],
-        "sun_altitude": astro["sun_altitude"],
-        "moon_phase": astro["moon_phase"],
-        "moon_illumination": astro["moon_illumination"],
-        "moon_altitude": astro["moon_altitude"],
+        astro["magnetic_latitude"],
+        astro["sun_altitude"],
+        astro["moon_phase"],
+        astro["moon_illumination"],
+        astro["moon_altitude"],
 
         # Weather
-        "cloudcover": weather["cloudcover"],
-        "precip": weather["precip"],
-        "temp": weather["temp"],
-        "pressure": weather["pressure"],
-        "windspeed": weather["windspeed"],
-        "winddir": weather["winddir"],
-        "dew": weather["dew"],
-        "humidity": weather["humidity"],
+        weather["cloudcover"],
+        weather["precip"],
+        weather["temp"],
+        weather["pressure"],
+        weather["windspeed"],
+        weather["winddir"],
+        weather["dew"],
+        weather["humidity"],
 
         # Space weather
-        "kp_index": space["kp_index"],
-        "bz": space["bz"],
-        "solar_wind_speed": space["solar_wind_speed"],
-        "solar_wind_density": space["solar_wind_density"],
-        "dst": space["dst"],
-    }
-
-    # Engineered features
-    features["is_dark"] = int(astro["sun_altitude"] < -6)
-    features["moon_interference"] = int(
-        astro["moon_altitude"] > 0 and astro["moon_illumination"] > 0.5
+        space["kp_index"],
+        space["bz"],
+        space["solar_wind_speed"],
+        space["solar_wind_density"],
+        space["dst"],
+
+        # Engineered features
+        is_dark,
+        astro["moon_altitude"] > 0 and astro["moon_illumination"] > 0.5,
+        storm,
+        space["dst"] < -50,
+        astro["magnetic_latitude"] * space["kp_index"],
+        is_dark and storm,
+        weather["cloudcover"] < 50 and is_dark,
+        space["solar_wind_speed"] * space["solar_wind_density"],
     )
-    features["storm"] = int(space["kp_index"] >= 5)
-    features["strong_storm"] = int(space["dst"] < -50)
-    features["lat_kp"] = astro["magnetic_latitude"] * space["kp_index"]
-    features["dark_storm"] = features["is_dark"] * features["storm"]
-    features["good_conditions"] = int(
-        weather["cloudcover"] < 50 and astro["sun_altitude"] < -6
-    )
-    features["sw_pressure"] = space["solar_wind_speed"] * space["solar_wind_density"]
-
-    return features
 
 
 # For testing
@@ -106,8 +102,9 @@ if __name__ == "__main__":
         "moon_phase": 0.1, "moon_illumination": 0.2, "moon_altitude": -20
     }
 
-    features = engineer_features(65.0, -18.0, weather, space, astro)
+    features = np.empty(len(FEATURE_ORDER), dtype=np.float32)
+    engineer_features_into(features, 65.0, -18.0, weather, space, astro)
 
     print("Feature Vector (30 features):")
-    for i, (k, v) in enumerate(features.items(), 1):
+    for i, (k, v) in enumerate(zip(FEATURE_ORDER, features), 1):
         print(f"  {i:2d}. {k}: {v}")
@@ -8,20 +8,25 @@ Fetches:
 - Solar wind density
 - Dst index
 
-Cached in Redis (2 min TTL) - data is global, same for all locations
+Cached in process (2 min TTL), backed by Redis so gunicorn workers share
+fetches - data is global, same for all locations
 """
+import asyncio
 import os
-import json
+import time
 import httpx
+import orjson
 from datetime import datetime, timedelta
 
 import redis
 
+from .client import CLIENT
+
 # Redis connection (use K8s service DNS name)
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379")
 CACHE_TTL = 120  # 2 minutes
 
-redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+redis_client = redis.Redis.from_url(REDIS_URL)  # raw bytes, parsed by orjson
 
 # NOAA SWPC endpoints (all free, no auth)
 NOAA_KP_URL = "https://services.swpc.noaa.gov/products/noaa-planetary-k-index.json"
@@ -31,24 +36,51 @@ KYOTO_DST_URL = "https://wdc.kugi.kyoto-u.ac.jp/dst_realtime/presentmonth/index.
 
 CACHE_KEY = "aurora:space_weather"
 
+# In-process cache, checked before Redis
+_CACHE = {"data": None, "exp": 0.0}
+_CACHE_LOCK = asyncio.Lock()
+
 
 async def get_space_weather() -> dict:
-    """Fetch current space weather conditions from NOAA (cached in Redis)"""
+    """Get current space weather conditions (cached in process, then Redis)"""
+    if time.monotonic() < _CACHE["exp"]:
+        return _CACHE["data"]
+
+    # Only one coroutine refreshes on expiry, the rest wait for its result
+    async with _CACHE_LOCK:
+        if time.monotonic() < _CACHE["exp"]:
+            return _CACHE["data"]
+
+        data, ttl = await _fetch_space_weather()
+        _CACHE["data"] = data
+        _CACHE["exp"] = time.monotonic() + ttl
+
+    return data
 
-    # Try cache first
+
+async def _fetch_space_weather() -> tuple[dict, float]:
+    """
+    Fetch current space weather conditions from NOAA (cached in Redis).
+    Returns the data and how many seconds it stays fresh, so a Redis hit
+    is only kept locally for the rest of its Redis lifetime.
+    """
+
+    # Try cache first (value and remaining lifetime in one round trip)
     try:
-        cached = redis_client.get(CACHE_KEY)
+        cached, ttl_ms = redis_client.pipeline().get(CACHE_KEY).pttl(CACHE_KEY).execute()
         if cached:
-            return json.loads(cached)
+            ttl = ttl_ms / 1000 if ttl_ms > 0 else CACHE_TTL
+            return orjson.loads(cached), min(ttl, CACHE_TTL)
     except Exception as e:
         print(f"Redis read error: {e}")
 
-    # Fetch fresh data
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        kp_index = await _get_kp(client)
-        plasma = await _get_plasma(client)
-        bz = await _get_bz(client)
-        dst = await _get_dst(client, kp_index)
+    # Fetch fresh data (independent endpoints, fetched concurrently)
+    kp_index, plasma, bz = await asyncio.gather(
+        _get_kp(CLIENT),
+        _get_plasma(CLIENT),
+        _get_bz(CLIENT),
+    )
+    dst = _get_dst(kp_index)
 
     data = {
         "kp_index": kp_index,
@@ -60,11 +92,11 @@ async def get_space_weather() -> dict:
 
     # Cache it
     try:
-        redis_client.setex(CACHE_KEY, CACHE_TTL, json.dumps(data))
+        redis_client.setex(CACHE_KEY, CACHE_TTL, orjson.dumps(data))
     except Exception as e:
         print(f"Redis write error: {e}")
 
-    return data
+    return data, CACHE_TTL
 
 
 async def _get_kp(client: httpx.AsyncClient) -> float:
@@ -125,7 +157,7 @@ async def _get_bz(client: httpx.AsyncClient) -> float:
     return 0.0  # Default neutral
 
 
-async def _get_dst(client: httpx.AsyncClient, kp_index: float) -> float:
+def _get_dst(kp_index: float) -> float:
     """
     Get Dst index.
     Kyoto WDC provides real-time Dst but parsing HTML is fragile.
@@ -150,10 +182,8 @@ async def _get_dst(client: httpx.AsyncClient, kp_index: float) -> float:
     return round(dst, 1)
 
 
-# For testing
+# For testing (run from the repo root: python -m inference.space_weather)
 if __name__ == "__main__":
-    import asyncio
-
     async def test():
         data = await get_space_weather()
         print("Space Weather Data:")
@@ -9,10 +9,14 @@ Required credentials (set in environment or config):
 
 Fallback: Open-Meteo (free, no auth) if WeatherKit fails
 """
+import asyncio
 import os
-import httpx
 import jwt
 import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from .client import CLIENT
 
 # WeatherKit config (set via environment variables)
 WEATHERKIT_KEY_ID = os.getenv("WEATHERKIT_KEY_ID")
@@ -23,33 +27,53 @@ WEATHERKIT_PRIVATE_KEY_PATH = os.getenv("WEATHERKIT_PRIVATE_KEY")
 WEATHERKIT_URL = "https://weatherkit.apple.com/api/v1/weather"
 OPENMETEO_URL = "https://api.open-meteo.com/v1/forecast"
 
+# Weather is cached per coordinate cell (0.01 deg, ~1 km), least recently used evicted
+CACHE_TTL = 300  # 5 minutes
+CACHE_MAX_ENTRIES = 10000
+_CACHE = OrderedDict()  # (lat, lon) cell -> (expiry, data)
+_INFLIGHT = {}  # (lat, lon) cell -> fetch task shared by concurrent requests
+
+# Signed WeatherKit token, reused until shortly before it expires
+TOKEN_TTL = 3600  # 1 hour
+TOKEN_REFRESH_MARGIN = 60
+_TOKEN_CACHE = {"token": None, "exp": 0}
 
-def _generate_weatherkit_token() -> str:
-    """Generate JWT token for WeatherKit API."""
-    if not all([WEATHERKIT_KEY_ID, WEATHERKIT_TEAM_ID, WEATHERKIT_SERVICE_ID, WEATHERKIT_PRIVATE_KEY_PATH]):
-        raise ValueError("WeatherKit credentials not configured")
 
+@lru_cache(maxsize=1)
+def _load_private_key() -> str:
+    """Read the WeatherKit private key once."""
     # Support both file path and direct key content
     if WEATHERKIT_PRIVATE_KEY_PATH.startswith("-----BEGIN"):
-        private_key = WEATHERKIT_PRIVATE_KEY_PATH
-    else:
-        with open(WEATHERKIT_PRIVATE_KEY_PATH, 'r') as f:
-            private_key = f.read()
+        return WEATHERKIT_PRIVATE_KEY_PATH
+
+    with open(WEATHERKIT_PRIVATE_KEY_PATH, 'r') as f:
+        return f.read()
+
+
+def _generate_weatherkit_token() -> str:
+    """Generate JWT token for WeatherKit API (cached for its validity period)."""
+    if not all([WEATHERKIT_KEY_ID, WEATHERKIT_TEAM_ID, WEATHERKIT_SERVICE_ID, WEATHERKIT_PRIVATE_KEY_PATH]):
+        raise ValueError("WeatherKit credentials not configured")
 
     now = int(time.time())
+    if _TOKEN_CACHE["token"] and now < _TOKEN_CACHE["exp"] - TOKEN_REFRESH_MARGIN:
+        return _TOKEN_CACHE["token"]
+
     payload = {
         "iss": WEATHERKIT_TEAM_ID,
         "iat": now,
-        "exp": now + 3600,  # 1 hour
+        "exp": now + TOKEN_TTL,
         "sub": WEATHERKIT_SERVICE_ID
     }
 
     token = jwt.encode(
         payload,
-        private_key,
+        _load_private_key(),
         algorithm="ES256",
         headers={"kid": WEATHERKIT_KEY_ID, "id": f"{WEATHERKIT_TEAM_ID}.{WEATHERKIT_SERVICE_ID}"}
     )
+    _TOKEN_CACHE["token"] = token
+    _TOKEN_CACHE["exp"] = payload["exp"]
     return token
 
 
@@ -61,10 +85,9 @@ async def _get_weatherkit(lat: float, lon: float) -> dict:
     params = {"dataSets": "currentWeather"}
     headers = {"Authorization": f"Bearer {token}"}
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+    response = await CLIENT.get(url, params=params, headers=headers)
+    response.raise_for_status()
+    data = response.json()
 
     current = data.get("currentWeather", {})
 
@@ -88,10 +111,9 @@ async def _get_openmeteo(lat: float, lon: float) -> dict:
         "current": "cloud_cover,precipitation,temperature_2m,pressure_msl,wind_speed_10m,wind_direction_10m,relative_humidity_2m,dew_point_2m"
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        response = await client.get(OPENMETEO_URL, params=params)
-        response.raise_for_status()
-        data = response.json()
+    response = await CLIENT.get(OPENMETEO_URL, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     current = data.get("current", {})
 
@@ -109,7 +131,34 @@ async def _get_openmeteo(lat: float, lon: float) -> dict:
 
 async def get_weather(lat: float, lon: float) -> dict:
     """
-    Get current weather for a location.
+    Get current weather for a location (cached per coordinate cell).
+    Concurrent requests for the same cell share a single upstream fetch.
+    """
+    key = (round(lat, 2), round(lon, 2))
+
+    cached = _CACHE.get(key)
+    if cached and time.monotonic() < cached[0]:
+        _CACHE.move_to_end(key)
+        return cached[1]
+
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_weather(lat, lon))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+
+    # Shield so one cancelled request doesn't cancel the fetch for the others
+    data = await asyncio.shield(task)
+    _CACHE[key] = (time.monotonic() + CACHE_TTL, data)
+    _CACHE.move_to_end(key)
+    if len(_CACHE) > CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return data
+
+
+async def _fetch_weather(lat: float, lon: float) -> dict:
+    """
+    Fetch current weather for a location.
     Uses WeatherKit if configured, falls back to Open-Meteo.
     """
     if all([WEATHERKIT_KEY_ID, WEATHERKIT_TEAM_ID, WEATHERKIT_SERVICE_ID, WEATHERKIT_PRIVATE_KEY_PATH]):
@@ -121,10 +170,8 @@ async def get_weather(lat: float, lon: float) -> dict:
     return await _get_openmeteo(lat, lon)
 
 
-# For testing
+# For testing (run from the repo root: python -m inference.weather)
 if __name__ == "__main__":
-    import asyncio
-
     async def test():
         # Test with Reykjavik
         lat, lon = 64.1, -21.9
@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import GradientBoostingClassifier
-from xgboost import XGBClassifier
+from xgboost import XGBClassifier, XGBRegressor
 import joblib
 import warnings
 warnings.filterwarnings('ignore')
@@ -24,15 +24,22 @@ df = pd.read_csv("data/training.csv")
 df = df[(df['aurora'] == 1) | (df['latitude'].abs() >= 40)]
 df = df.drop(columns=["datetime", "year", "windgust", "uvindex", "solarradiation", "visibility"])
 
-# Feature engineering
-df['is_dark'] = (df['sun_altitude'] < -6).astype(int)
-df['moon_interference'] = ((df['moon_altitude'] > 0) & (df['moon_illumination'] > 0.5)).astype(int)
-df['storm'] = (df['kp_index'] >= 5).astype(int)
-df['strong_storm'] = (df['dst'] < -50).astype(int)
-df['lat_kp'] = df['magnetic_latitude'] * df['kp_index']
-df['dark_storm'] = df['is_dark'] * df['storm']
-df['good_conditions'] = ((df['cloudcover'] < 50) & (df['sun_altitude'] < -6)).astype(int)
-df['sw_pressure'] = df['solar_wind_speed'] * df['solar_wind_density']
+# Feature engineering (plain NumPy arrays, added to the frame in one assign)
+sun_altitude = df['sun_altitude'].to_numpy()
+kp_index = df['kp_index'].to_numpy()
+is_dark = sun_altitude < -6
+storm = kp_index >= 5
+
+df = df.assign(
+    is_dark=is_dark.view(np.uint8),
+    moon_interference=((df['moon_altitude'].to_numpy() > 0) & (df['moon_illumination'].to_numpy() > 0.5)).view(np.uint8),
+    storm=storm.view(np.uint8),
+    strong_storm=(df['dst'].to_numpy() < -50).view(np.uint8),
+    lat_kp=df['magnetic_latitude'].to_numpy() * kp_index,
+    dark_storm=(is_dark & storm).view(np.uint8),
+    good_conditions=((df['cloudcover'].to_numpy() < 50) & is_dark).view(np.uint8),
+    sw_pressure=df['solar_wind_speed'].to_numpy() * df['solar_wind_density'].to_numpy(),
+)
 
 X = df.drop(columns=["aurora"])
 X = X.fillna(X.median())
@@ -55,10 +62,15 @@ gb = GradientBoostingClassifier(
 gb.fit(X_train, y_train)
 
 print("Training XGBoost...")
+# Hold out part of the training set to decide when to stop adding trees
+X_fit, X_val, y_fit, y_val = train_test_split(X_train, y_train, test_size=0.15, random_state=42)
 xgb = XGBClassifier(
     random_state=42,
+    tree_method='hist',
+    device='cpu',
     max_depth=4,
-    n_estimators=200,
+    n_estimators=400,
+    early_stopping_rounds=20,
     learning_rate=0.1,
     subsample=0.7,
     colsample_bytree=0.8,
@@ -67,7 +79,21 @@ xgb = XGBClassifier(
     reg_lambda=1.0,
     eval_metric='logloss'
 )
-xgb.fit(X_train, y_train)
+xgb.fit(X_fit, y_fit, eval_set=[(X_val, y_val)], verbose=False)
+print(f"  Early stopping kept {xgb.best_iteration + 1} trees")
+
+# Distill the GB + XGB average into one smaller model (soft-label training)
+print("Training distilled model...")
+soft_targets = (gb.predict_proba(X_train)[:, 1] + xgb.predict_proba(X_train)[:, 1]) / 2
+distilled = XGBRegressor(
+    random_state=42,
+    objective='reg:logistic',
+    tree_method='hist',
+    max_depth=4,
+    n_estimators=100,
+    learning_rate=0.1
+)
+distilled.fit(X_train, soft_targets)
 
 # Test dual system
 print("\n" + "=" * 70)
@@ -87,31 +113,21 @@ print(f"  Max difference: {diff.max():.3f}")
 print(f"  Samples with >20% disagreement: {(diff > 0.2).sum()} ({(diff > 0.2).mean()*100:.1f}%)")
 print(f"  Samples with >10% disagreement: {(diff > 0.1).sum()} ({(diff > 0.1).mean()*100:.1f}%)")
 
-# Confidence levels
-def get_confidence(gb_p, xgb_p):
-    avg = (gb_p + xgb_p) / 2
-    diff = abs(gb_p - xgb_p)
-
-    if diff < 0.1:
-        agreement = "strong"
-    elif diff < 0.2:
-        agreement = "moderate"
-    else:
-        agreement = "weak"
-
-    return avg, agreement
-
 # Test on a few samples
 print(f"\n{'='*70}")
 print("SAMPLE PREDICTIONS")
 print("=" * 70)
-print(f"{'GB':>8} {'XGB':>8} {'Avg':>8} {'Agree':>10} {'Actual':>8}")
-print("-" * 50)
 
-for i in range(min(20, len(X_test))):
-    avg, agreement = get_confidence(gb_proba[i], xgb_proba[i])
-    actual = "AURORA" if y_test.iloc[i] == 1 else "no"
-    print(f"{gb_proba[i]:>7.1%} {xgb_proba[i]:>7.1%} {avg:>7.1%} {agreement:>10} {actual:>8}")
+n = min(20, len(X_test))
+sample_diff = diff[:n]
+samples = pd.DataFrame({
+    "GB": gb_proba[:n],
+    "XGB": xgb_proba[:n],
+    "Avg": avg_proba[:n],
+    "Agree": np.where(sample_diff < 0.1, "strong", np.where(sample_diff < 0.2, "moderate", "weak")),
+    "Actual": np.where(y_test.values[:n] == 1, "AURORA", "no"),
+})
+print(samples.to_string(index=False, formatters={col: "{:.1%}".format for col in ("GB", "XGB", "Avg")}))
 
 # Accuracy at different confidence levels
 print(f"\n{'='*70}")
@@ -133,7 +149,12 @@ print(f"\nOverall (averaged): {overall_acc:.1%}")
 print(f"GB alone: {gb.score(X_test, y_test):.1%}")
 print(f"XGB alone: {xgb.score(X_test, y_test):.1%}")
 
-# Save both models
+# Distilled model vs the dual system it imitates
+distilled_proba = distilled.predict(X_test)
+distilled_acc = ((distilled_proba >= 0.5).astype(int) == y_test.values).mean()
+print(f"Distilled: {distilled_acc:.1%} (mean diff from average: {np.abs(distilled_proba - avg_proba).mean():.3f})")
+
+# Save all models (dual system + distilled)
 print(f"\n{'='*70}")
 print("SAVING MODELS")
 print("=" * 70)
@@ -142,9 +163,11 @@ import os
 os.makedirs('models', exist_ok=True)
 joblib.dump(gb, 'models/gb.joblib')
 joblib.dump(xgb, 'models/xgb.joblib')
+joblib.dump(distilled, 'models/distilled.joblib')
 
 print(f"Saved: models/gb.joblib ({gb.__class__.__name__})")
 print(f"Saved: models/xgb.joblib ({xgb.__class__.__name__})")
+print(f"Saved: models/distilled.joblib ({distilled.__class__.__name__})")
 
 print(f"\n{'='*70}")
 print("INFERENCE EXAMPLE")